@@ -1,5 +1,8 @@
 # Configuration file for AI Thumbnail & Metadata Generator
 
+import os
+import tempfile
+
 # API configuration
 OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
 HF_IMAGE_API_URL = "https://api-inference.huggingface.co/models/"
@@ -24,6 +27,32 @@ STYLE_PROMPTS = {
     "Tech": "tech style, sleek, modern, blue and white, professional, corporate"
 }
 
+# Thumbnail storage configuration
+# Finished thumbnails are written to disk and passed around as file paths so
+# full-resolution images don't stay in worker memory between requests.
+THUMBNAIL_STORAGE_DIR = os.getenv(
+    "THUMBNAIL_STORAGE_DIR", os.path.join(tempfile.gettempdir(), "ai_thumbnails")
+)
+# Gradio copies returned files into its own cache; keep a private one under the managed
+# directory (an inherited GRADIO_TEMP_DIR may be shared, so it is deliberately ignored)
+GRADIO_CACHE_DIR = os.path.join(THUMBNAIL_STORAGE_DIR, "gradio")
+THUMBNAIL_MAX_AGE_SECONDS = int(os.getenv("THUMBNAIL_MAX_AGE_SECONDS", "3600"))
+THUMBNAIL_CLEANUP_INTERVAL_SECONDS = int(os.getenv("THUMBNAIL_CLEANUP_INTERVAL_SECONDS", "600"))
+
+# Offline metadata fallback
+# Precomputed tag/title index built with `python tag_index.py <exports>`
+TAG_INDEX_PATH = os.getenv(
+    "TAG_INDEX_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "tag_index.bin")
+)
+# Serve from the fallback as soon as the deadline passes instead of waiting for the request
+METADATA_FAST_FAIL = os.getenv("METADATA_FAST_FAIL", "false").lower() in ("1", "true", "yes")
+# Seconds to wait for OpenRouter before serving fallback metadata (shorter by default in fast-fail mode)
+METADATA_DEADLINE_SECONDS = float(
+    os.getenv("METADATA_DEADLINE_SECONDS", "15" if METADATA_FAST_FAIL else "60")
+)
+# In fast-fail mode, skip OpenRouter for this many seconds after a timeout or rate limit
+METADATA_CIRCUIT_BREAKER_SECONDS = float(os.getenv("METADATA_CIRCUIT_BREAKER_SECONDS", "30"))
+
 # Global variables for API keys
 current_hf_token = ""
 current_openrouter_token = ""
\ No newline at end of file
@@ -1,5 +1,25 @@
 import json
 from datetime import datetime
+from thumbnail_storage import save_thumbnail, get_memory_usage_mb
+
+_generators = None
+
+
+def load_generators():
+    """Import the generator modules once and return their entry points"""
+    global _generators
+    if _generators is None:
+        from metadata_generator import generate_metadata
+        from image_generator import generate_thumbnails
+        _generators = (generate_metadata, generate_thumbnails)
+    return _generators
+
+
+def warm_up():
+    """Load generators, fonts and prerendered assets before the first request"""
+    load_generators()
+    from image_generator import preload_assets
+    preload_assets()
 
 
 def create_download_data(topic, metadata, thumbnail1, thumbnail2, selected_thumbnail):
@@ -39,16 +59,24 @@ def process_content(topic, style, model_choice, text_overlay, overlay_style):
         return "Please enter a topic!", None, None, ""
     
     print(f"Processing: {topic}")
+    generate_metadata, generate_thumbnails = load_generators()
+    memory_before = get_memory_usage_mb()
     
     # Generate metadata
     print("Generating metadata...")
-    from metadata_generator import generate_metadata
     metadata = generate_metadata(topic, model_choice)
     
     print("Generating thumbnails...")
-    from image_generator import generate_thumbnails
     thumbnail1, thumbnail2 = generate_thumbnails(topic, style, text_overlay, overlay_style)
     
+    # Spill finished thumbnails to disk so only file paths are kept around
+    thumbnail1 = save_thumbnail(thumbnail1)
+    thumbnail2 = save_thumbnail(thumbnail2)
+    
+    memory_after = get_memory_usage_mb()
+    if memory_before is not None and memory_after is not None:
+        print(f"📊 Process RSS: {memory_after:.1f} MB ({memory_after - memory_before:+.1f} MB while handling this request, including other sessions)")
+    
     print("Complete!")
     
     # Create download data
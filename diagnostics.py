@@ -0,0 +1,34 @@
+import importlib
+import sys
+import time
+
+
+def timed_import(module_name):
+    """Import a module and return it with the seconds the import took"""
+    if module_name in sys.modules:
+        return sys.modules[module_name], 0.0
+    start = time.perf_counter()
+    module = importlib.import_module(module_name)
+    return module, time.perf_counter() - start
+
+
+def report_import_times(module_names):
+    """Import modules in order and print how long each one took.
+
+    Modules are timed in the given order, so shared dependencies are charged
+    to the first module that pulls them in.
+    """
+    timings = []
+    for name in module_names:
+        try:
+            _, elapsed = timed_import(name)
+        except ImportError as e:
+            print(f"❌ Could not import {name}: {e}")
+            continue
+        timings.append((name, elapsed))
+    
+    print("⏱️  Import times:")
+    for name, elapsed in timings:
+        print(f"   {name:<22} {elapsed * 1000:8.1f} ms")
+    print(f"   {'total':<22} {sum(e for _, e in timings) * 1000:8.1f} ms")
+    return timings
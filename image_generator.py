@@ -1,30 +1,72 @@
 import io
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFont
 from config import IMAGE_MODELS, HF_IMAGE_API_URL, STYLE_PROMPTS
 from api_utils import query_hf_api
 
+# Font file, width divisor and minimum size for each overlay style
+OVERLAY_FONTS = {
+    "bold": ("arial.ttf", 20, 24),
+    "elegant": ("times.ttf", 25, 20),
+    "clean": ("calibri.ttf", 30, 18),
+}
+
+
+@lru_cache(maxsize=32)
+def load_font(font_file, size):
+    """Load a TrueType font once per file and size, falling back to the default font"""
+    try:
+        return ImageFont.truetype(font_file, size)
+    except OSError:
+        return ImageFont.load_default()
+
+
+def _placeholder_font():
+    try:
+        return load_font("arial.ttf", 36)
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=1)
+def _placeholder_base():
+    """Render the static parts of the placeholder image once"""
+    img = Image.new('RGB', (1280, 720), color=(100, 149, 237))
+    draw = ImageDraw.Draw(img)
+    font = _placeholder_font()
+    
+    if font:
+        # Add title
+        title = "Placeholder Thumbnail"
+        bbox = draw.textbbox((0, 0), title, font=font)
+        text_width = bbox[2] - bbox[0]
+        x = (1280 - text_width) // 2
+        draw.text((x, 200), title, fill='white', font=font)
+        
+        # Add note
+        note = "AI generation failed - using placeholder"
+        bbox = draw.textbbox((0, 0), note, font=font)
+        text_width = bbox[2] - bbox[0]
+        x = (1280 - text_width) // 2
+        draw.text((x, 400), note, fill='yellow', font=font)
+    
+    return img
+
+
+def preload_assets():
+    """Warm the font cache and placeholder image so the first request doesn't pay for them"""
+    width = 1280
+    for font_file, divisor, min_size in OVERLAY_FONTS.values():
+        load_font(font_file, max(min_size, width // divisor))
+    _placeholder_base()
+
 
 def create_placeholder_image(prompt):
     """Create a placeholder image when generation fails"""
     try:
-        img = Image.new('RGB', (1280, 720), color=(100, 149, 237))
+        img = _placeholder_base().copy()
         draw = ImageDraw.Draw(img)
-        
-        try:
-            font = ImageFont.truetype("arial.ttf", 36)
-        except:
-            try:
-                font = ImageFont.load_default()
-            except:
-                font = None
-        
-        # Add title
-        title = "Placeholder Thumbnail"
-        if font:
-            bbox = draw.textbbox((0, 0), title, font=font)
-            text_width = bbox[2] - bbox[0]
-            x = (1280 - text_width) // 2
-            draw.text((x, 200), title, fill='white', font=font)
+        font = _placeholder_font()
         
         # Add prompt
         prompt_text = f"Topic: {prompt[:50]}..."
@@ -34,14 +76,6 @@ def create_placeholder_image(prompt):
             x = (1280 - text_width) // 2
             draw.text((x, 300), prompt_text, fill='lightgray', font=font)
         
-        # Add note
-        note = "AI generation failed - using placeholder"
-        if font:
-            bbox = draw.textbbox((0, 0), note, font=font)
-            text_width = bbox[2] - bbox[0]
-            x = (1280 - text_width) // 2
-            draw.text((x, 400), note, fill='yellow', font=font)
-        
         return img
     except Exception as e:
         print(f"Error creating placeholder: {e}")
@@ -61,19 +95,10 @@ def add_text_overlay(image, title_text, style="bold"):
     # Get image dimensions
     width, height = img.size
     
-    # Try to load fonts
-    try:
-        if style == "bold":
-            font_size = max(24, width // 20)
-            font = ImageFont.truetype("arial.ttf", font_size)
-        elif style == "elegant":
-            font_size = max(20, width // 25)
-            font = ImageFont.truetype("times.ttf", font_size)
-        else:  # clean
-            font_size = max(18, width // 30)
-            font = ImageFont.truetype("calibri.ttf", font_size)
-    except:
-        font = ImageFont.load_default()
+    # Load font for the style (unknown styles use clean)
+    font_file, divisor, min_size = OVERLAY_FONTS.get(style, OVERLAY_FONTS["clean"])
+    font_size = max(min_size, width // divisor)
+    font = load_font(font_file, font_size)
     
     # Wrap text to fit image width
     words = title_text.split()
@@ -114,6 +139,13 @@ def add_text_overlay(image, title_text, style="bold"):
     return img
 
 
+def _replace_image(old_image, new_image):
+    """Close an intermediate image once its replacement exists"""
+    if new_image is not old_image:
+        old_image.close()
+    return new_image
+
+
 def generate_image(prompt, model_choice="fast"):
     """Generate image using Hugging Face Inference API"""
     try:
@@ -165,15 +197,15 @@ def generate_thumbnails(topic, style, text_overlay="", overlay_style="bold"):
     # Resize to YouTube thumbnail dimensions (16:9)
     target_size = (1280, 720)
     if thumbnail1:
-        thumbnail1 = thumbnail1.resize(target_size, Image.Resampling.LANCZOS)
+        thumbnail1 = _replace_image(thumbnail1, thumbnail1.resize(target_size, Image.Resampling.LANCZOS))
     if thumbnail2:
-        thumbnail2 = thumbnail2.resize(target_size, Image.Resampling.LANCZOS)
+        thumbnail2 = _replace_image(thumbnail2, thumbnail2.resize(target_size, Image.Resampling.LANCZOS))
     
     # Add text overlay if provided
     if text_overlay.strip():
         if thumbnail1:
-            thumbnail1 = add_text_overlay(thumbnail1, text_overlay, overlay_style)
+            thumbnail1 = _replace_image(thumbnail1, add_text_overlay(thumbnail1, text_overlay, overlay_style))
         if thumbnail2:
-            thumbnail2 = add_text_overlay(thumbnail2, text_overlay, overlay_style)
+            thumbnail2 = _replace_image(thumbnail2, add_text_overlay(thumbnail2, text_overlay, overlay_style))
     
     return thumbnail1, thumbnail2
\ No newline at end of file
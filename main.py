@@ -5,8 +5,6 @@ Main entry point for the application
 """
 
 import os
-from config import current_hf_token, current_openrouter_token
-from ui import create_gradio_ui
 
 # Load environment variables from .env file
 try:
@@ -15,6 +13,14 @@ try:
 except ImportError:
     print("⚠️  python-dotenv not installed. Using system environment variables only.")
 
+# config reads environment variables at import time, so it is imported after .env is loaded
+from config import GRADIO_CACHE_DIR, current_hf_token, current_openrouter_token
+from diagnostics import report_import_times
+from thumbnail_storage import ensure_storage_dir, start_cleanup_scheduler
+
+# Heavy modules needed to serve the UI, timed at startup in load order
+UI_MODULES = ["requests", "PIL.Image", "PIL.ImageFont", "gradio", "metadata_generator", "image_generator", "ui"]
+
 def main():
     """Main function to launch the application"""
     print("🚀 Starting AI Thumbnail & Metadata Generator...")
@@ -40,6 +46,20 @@ def main():
     if not hf_env_token and not openrouter_env_token:
         print("⚠️  No API tokens found in environment - use the app UI to set them")
     
+    # Point Gradio's file cache at the private directory the cleanup scheduler manages
+    os.environ["GRADIO_TEMP_DIR"] = GRADIO_CACHE_DIR
+    
+    # Gradio, PIL and requests are only imported here, when the UI is actually launched
+    report_import_times(UI_MODULES)
+    from ui import create_gradio_ui
+    from content_processor import warm_up
+    
+    # Initialize generators, fonts and placeholder once, before the first request
+    warm_up()
+    
+    # Periodically remove old thumbnails from disk storage
+    start_cleanup_scheduler()
+    
     # Create and launch the Gradio app
     app = create_gradio_ui()
     
@@ -47,7 +67,8 @@ def main():
         share=False,
         server_name="0.0.0.0",
         server_port=7860,
-        show_error=True
+        show_error=True,
+        allowed_paths=[ensure_storage_dir()]
     )
 
 if __name__ == "__main__":
@@ -1,7 +1,22 @@
 import requests
 import random
 import re
-from config import TEXT_MODELS, OPENROUTER_API_URL, current_openrouter_token
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from config import (
+    TEXT_MODELS,
+    OPENROUTER_API_URL,
+    METADATA_DEADLINE_SECONDS,
+    METADATA_FAST_FAIL,
+    METADATA_CIRCUIT_BREAKER_SECONDS,
+    current_openrouter_token,
+)
+from tag_index import get_tag_index
+
+# Runs OpenRouter calls in fast-fail mode so the caller can stop waiting at the deadline
+_request_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="openrouter")
+# While time.monotonic() is below this, fast-fail mode skips OpenRouter entirely
+_circuit_open_until = 0.0
 
 
 def create_smart_fallback_metadata(topic):
@@ -31,14 +46,58 @@ def create_smart_fallback_metadata(topic):
     base_tags = [topic.lower().replace(" ", "-")]
     topic_words = topic.lower().split()
     
+    # Prefer tags and titles learned from past metadata when the index is available
+    suggested_tags = []
+    index = get_tag_index()
+    if index:
+        suggested_tags = index.suggest_tags(topic, 5)
+        title_templates = index.suggest_titles(topic, 3) or title_templates
+    
     common_tags = ["tutorial", "guide", "tips", "howto", "learn", "beginner", "expert", "professional"]
-    selected_tags = base_tags + topic_words + random.sample(common_tags, 3)
+    selected_tags = list(dict.fromkeys(base_tags + topic_words + suggested_tags))
+    if len(selected_tags) < 7:
+        remaining = [t for t in common_tags if t not in selected_tags]
+        selected_tags += random.sample(remaining, min(3, len(remaining)))
     
     return f"""TITLE: {random.choice(title_templates)}
 DESCRIPTION: {random.choice(desc_templates)}
 TAGS: {", ".join(selected_tags[:7])}"""
 
 
+def _open_circuit(reason):
+    global _circuit_open_until
+    _circuit_open_until = time.monotonic() + METADATA_CIRCUIT_BREAKER_SECONDS
+    print(f"🚧 {reason} - skipping OpenRouter for {METADATA_CIRCUIT_BREAKER_SECONDS}s")
+
+
+def post_openrouter(headers, payload):
+    """POST to OpenRouter, returning None if fast-fail is on and the call is skipped or times out"""
+    if not METADATA_FAST_FAIL:
+        return requests.post(OPENROUTER_API_URL, headers=headers, json=payload, timeout=METADATA_DEADLINE_SECONDS)
+    
+    if time.monotonic() < _circuit_open_until:
+        print("🚧 OpenRouter recently timed out or rate limited us, not calling it")
+        return None
+    
+    future = _request_executor.submit(
+        requests.post, OPENROUTER_API_URL, headers=headers, json=payload, timeout=METADATA_DEADLINE_SECONDS
+    )
+    try:
+        response = future.result(timeout=METADATA_DEADLINE_SECONDS)
+    except FutureTimeoutError:
+        # Drop the call if it is still queued so it isn't sent after we've given up on it.
+        # A call that is already running can't be stopped: it holds its pool thread until
+        # requests returns (its timeout is per socket read, not per call), so stuck calls
+        # can fill the pool. The circuit breaker is what stops new calls from piling up.
+        future.cancel()
+        _open_circuit(f"No response from OpenRouter within {METADATA_DEADLINE_SECONDS}s")
+        return None
+    
+    if response.status_code == 429:
+        _open_circuit("OpenRouter rate limit hit")
+    return response
+
+
 def generate_metadata(topic, model_choice="deepseek-r1-free"):
     """Generate YouTube metadata using OpenRouter API"""
     try:
@@ -67,7 +126,10 @@ def generate_metadata(topic, model_choice="deepseek-r1-free"):
             "Content-Type": "application/json"
         }
         print(f"🔄 Calling OpenRouter API for {model_name}")
-        response = requests.post(OPENROUTER_API_URL, headers=headers, json=payload, timeout=60)
+        response = post_openrouter(headers, payload)
+        if response is None:
+            print("⚠️ Using smart fallback response...")
+            return create_smart_fallback_metadata(topic)
         print(f"📡 Response status: {response.status_code}")
         if response.status_code == 200:
             result = response.json()
@@ -0,0 +1,248 @@
+"""
+Precomputed tag and title index for offline metadata fallback.
+
+The index is built offline from past metadata exports (the JSON produced by
+create_download_data) and stored in a compact binary file that is memory-mapped
+on first use, so lookups don't need to parse or load the whole corpus.
+
+Build it with:
+    python tag_index.py exports/ -o tag_index.bin
+"""
+
+import json
+import mmap
+import os
+import re
+import struct
+import threading
+from collections import Counter, defaultdict
+from config import TAG_INDEX_PATH
+
+MAGIC = b"TAGIDX01"
+HEADER = struct.Struct("<8sII")       # magic, token count, string count
+TOKEN_ENTRY = struct.Struct("<IIIII")  # token id, tag offset, tag count, title offset, title count
+POSTING = struct.Struct("<II")         # string id, weight
+OFFSET = struct.Struct("<I")
+
+MAX_POSTINGS_PER_TOKEN = 32
+TOPIC_PLACEHOLDER = "{topic}"
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "how", "in",
+    "is", "it", "of", "on", "or", "the", "to", "vs", "what", "why", "with", "your",
+}
+
+_index = None
+_index_loaded = False
+_index_lock = threading.Lock()
+
+
+def tokenize(text):
+    """Split text into lowercase topic tokens, dropping stopwords"""
+    return [t for t in re.findall(r"[a-z0-9]+", text.lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+def _normalize_tag(tag):
+    return tag.strip().lower().lstrip("#")
+
+
+def _load_corpus_records(paths):
+    """Yield (topic, title, tags) from exported metadata JSON/JSONL files"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.endswith((".json", ".jsonl")):
+                    files.append(os.path.join(path, name))
+        else:
+            files.append(path)
+
+    for file_path in files:
+        with open(file_path, encoding="utf-8") as f:
+            if file_path.endswith(".jsonl"):
+                records = [json.loads(line) for line in f if line.strip()]
+            else:
+                data = json.load(f)
+                records = data if isinstance(data, list) else [data]
+
+        for record in records:
+            topic = record.get("topic", "")
+            metadata = record.get("metadata", {})
+            tags = metadata.get("tags", [])
+            if isinstance(tags, str):
+                tags = tags.split(",")
+            if topic.strip():
+                yield topic.strip(), metadata.get("title", "").strip(), tags
+
+
+def build_tag_index(corpus_paths, output_path=TAG_INDEX_PATH):
+    """Build the binary tag index from a corpus of past metadata exports"""
+    tag_weights = defaultdict(Counter)
+    title_weights = defaultdict(Counter)
+    record_count = 0
+
+    for topic, title, tags in _load_corpus_records(corpus_paths):
+        record_count += 1
+        tokens = set(tokenize(topic))
+        tags = {_normalize_tag(t) for t in tags if _normalize_tag(t)}
+
+        # Keep titles that mention the topic as reusable templates
+        template = None
+        if title:
+            pattern = re.compile(re.escape(topic), re.IGNORECASE)
+            if pattern.search(title):
+                template = pattern.sub(TOPIC_PLACEHOLDER, title, count=1)
+
+        for token in tokens:
+            for tag in tags:
+                if tag != token:
+                    tag_weights[token][tag] += 1
+            if template:
+                title_weights[token][template] += 1
+
+    # Intern all strings so postings only store ids
+    strings = {}
+
+    def intern(s):
+        if s not in strings:
+            strings[s] = len(strings)
+        return strings[s]
+
+    tokens = sorted(set(tag_weights) | set(title_weights))
+    token_ids = [intern(t) for t in tokens]
+
+    postings = bytearray()
+    entries = []
+    for token, token_id in zip(tokens, token_ids):
+        tag_offset = len(postings) // POSTING.size
+        top_tags = tag_weights[token].most_common(MAX_POSTINGS_PER_TOKEN)
+        for tag, weight in top_tags:
+            postings += POSTING.pack(intern(tag), weight)
+
+        title_offset = len(postings) // POSTING.size
+        top_titles = title_weights[token].most_common(MAX_POSTINGS_PER_TOKEN)
+        for title, weight in top_titles:
+            postings += POSTING.pack(intern(title), weight)
+
+        entries.append(TOKEN_ENTRY.pack(token_id, tag_offset, len(top_tags), title_offset, len(top_titles)))
+
+    blob = bytearray()
+    offsets = bytearray()
+    for s in strings:  # dicts keep insertion order, which matches the ids
+        offsets += OFFSET.pack(len(blob))
+        blob += s.encode("utf-8")
+    offsets += OFFSET.pack(len(blob))
+
+    with open(output_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(tokens), len(strings)))
+        f.write(b"".join(entries))
+        f.write(offsets)
+        f.write(postings)
+        f.write(blob)
+
+    print(f"✅ Built tag index from {record_count} records: {len(tokens)} tokens, {len(strings)} strings -> {output_path}")
+    return output_path
+
+
+class TagIndex:
+    """Read-only view over a memory-mapped tag index file"""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self._token_count, self._string_count = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self._mm.close()
+            raise ValueError(f"Not a tag index file: {path}")
+
+        self._entries_start = HEADER.size
+        self._offsets_start = self._entries_start + self._token_count * TOKEN_ENTRY.size
+        self._postings_start = self._offsets_start + (self._string_count + 1) * OFFSET.size
+        blob_offset = OFFSET.unpack_from(self._mm, self._offsets_start + self._string_count * OFFSET.size)[0]
+        self._blob_start = len(self._mm) - blob_offset
+
+    def _string(self, string_id):
+        start, end = struct.unpack_from("<II", self._mm, self._offsets_start + string_id * OFFSET.size)
+        return self._mm[self._blob_start + start:self._blob_start + end].decode("utf-8")
+
+    def _find_token(self, token):
+        """Binary search the sorted token table"""
+        lo, hi = 0, self._token_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            entry = TOKEN_ENTRY.unpack_from(self._mm, self._entries_start + mid * TOKEN_ENTRY.size)
+            current = self._string(entry[0])
+            if current == token:
+                return entry
+            if current < token:
+                lo = mid + 1
+            else:
+                hi = mid
+        return None
+
+    def _postings(self, offset, count):
+        start = self._postings_start + offset * POSTING.size
+        for i in range(count):
+            yield POSTING.unpack_from(self._mm, start + i * POSTING.size)
+
+    def _lookup(self, topic, use_titles):
+        scores = Counter()
+        for token in set(tokenize(topic)):
+            entry = self._find_token(token)
+            if entry is None:
+                continue
+            offset, count = (entry[3], entry[4]) if use_titles else (entry[1], entry[2])
+            for string_id, weight in self._postings(offset, count):
+                scores[string_id] += weight
+        return scores
+
+    def suggest_tags(self, topic, limit=5):
+        """Return the tags most often used alongside the topic's tokens"""
+        topic_tokens = set(tokenize(topic))
+        tags = []
+        for string_id, _ in self._lookup(topic, use_titles=False).most_common():
+            tag = self._string(string_id)
+            if tag not in topic_tokens:
+                tags.append(tag)
+            if len(tags) >= limit:
+                break
+        return tags
+
+    def suggest_titles(self, topic, limit=3):
+        """Return past title templates filled in with the topic"""
+        return [
+            self._string(string_id).replace(TOPIC_PLACEHOLDER, topic)
+            for string_id, _ in self._lookup(topic, use_titles=True).most_common(limit)
+        ]
+
+    def close(self):
+        self._mm.close()
+
+
+def get_tag_index():
+    """Return the shared tag index, loading it on first use (None if unavailable)"""
+    global _index, _index_loaded
+    if _index_loaded:
+        return _index
+
+    with _index_lock:
+        if not _index_loaded:
+            if os.path.exists(TAG_INDEX_PATH) and os.path.getsize(TAG_INDEX_PATH) > 0:
+                try:
+                    _index = TagIndex(TAG_INDEX_PATH)
+                    print(f"📚 Loaded tag index from {TAG_INDEX_PATH}")
+                except Exception as e:
+                    print(f"❌ Could not load tag index: {e}")
+            _index_loaded = True
+    return _index
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build the offline tag index from past metadata exports")
+    parser.add_argument("corpus", nargs="+", help="Exported metadata .json/.jsonl files or directories")
+    parser.add_argument("-o", "--output", default=TAG_INDEX_PATH, help="Output index file")
+    args = parser.parse_args()
+    build_tag_index(args.corpus, args.output)
@@ -0,0 +1,156 @@
+import hashlib
+import io
+import os
+import re
+import threading
+import time
+from config import (
+    THUMBNAIL_STORAGE_DIR,
+    GRADIO_CACHE_DIR,
+    THUMBNAIL_MAX_AGE_SECONDS,
+    THUMBNAIL_CLEANUP_INTERVAL_SECONDS,
+)
+
+# Files written by save_thumbnail (including leftover temp files) and Gradio's per-file cache folders
+_STORED_FILE = re.compile(r"^[0-9a-f]{64}\.png(\..+\.tmp)?$")
+_GRADIO_CACHE_SUBDIR = re.compile(r"^[0-9a-f]{40,64}$")
+
+_cleanup_timer = None
+_cleanup_lock = threading.Lock()
+# Held while saving or removing a stored thumbnail so cleanup can't delete a file that was just reused
+_storage_lock = threading.Lock()
+
+
+def ensure_storage_dir():
+    """Create the thumbnail storage directory if it doesn't exist"""
+    os.makedirs(THUMBNAIL_STORAGE_DIR, exist_ok=True)
+    return THUMBNAIL_STORAGE_DIR
+
+
+def save_thumbnail(image):
+    """Write a thumbnail to content-addressed storage and release its pixels.
+
+    Returns the file path, or None if there is no image.
+    """
+    if image is None:
+        return None
+
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    image.close()
+    data = buffer.getvalue()
+    buffer.close()
+
+    digest = hashlib.sha256(data).hexdigest()
+    path = os.path.join(ensure_storage_dir(), f"{digest}.png")
+
+    with _storage_lock:
+        if os.path.exists(path):
+            # Same content already stored - just refresh its age
+            try:
+                os.utime(path, None)
+                return path
+            except FileNotFoundError:
+                pass  # Removed by another worker process's cleanup - write it again
+
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    return path
+
+
+def _remove_if_expired(path, cutoff):
+    """Remove a file if it was last modified before cutoff, returning 1 if removed"""
+    try:
+        if os.path.getmtime(path) < cutoff:
+            os.remove(path)
+            return 1
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        print(f"⚠️ Could not remove {path}: {e}")
+    return 0
+
+
+def cleanup_old_thumbnails(max_age=THUMBNAIL_MAX_AGE_SECONDS):
+    """Delete stored thumbnails and Gradio's cached copies older than max_age seconds.
+
+    Only files written by save_thumbnail and Gradio's hash folders are touched.
+    """
+    cutoff = time.time() - max_age
+    removed = 0
+
+    if os.path.isdir(THUMBNAIL_STORAGE_DIR):
+        for name in os.listdir(THUMBNAIL_STORAGE_DIR):
+            if _STORED_FILE.match(name):
+                with _storage_lock:
+                    removed += _remove_if_expired(os.path.join(THUMBNAIL_STORAGE_DIR, name), cutoff)
+
+    if os.path.isdir(GRADIO_CACHE_DIR):
+        for name in os.listdir(GRADIO_CACHE_DIR):
+            dir_path = os.path.join(GRADIO_CACHE_DIR, name)
+            if not _GRADIO_CACHE_SUBDIR.match(name) or not os.path.isdir(dir_path):
+                continue
+            try:
+                for file_name in os.listdir(dir_path):
+                    file_path = os.path.join(dir_path, file_name)
+                    if os.path.isfile(file_path):
+                        removed += _remove_if_expired(file_path, cutoff)
+                # Gradio creates the folder before copying into it, so only remove old empty ones
+                if os.path.getmtime(dir_path) < cutoff and not os.listdir(dir_path):
+                    os.rmdir(dir_path)
+            except OSError:
+                pass  # Removed or refilled concurrently
+
+    if removed:
+        print(f"🧹 Removed {removed} old thumbnail(s)")
+    return removed
+
+
+def _run_scheduled_cleanup(interval):
+    global _cleanup_timer
+    try:
+        cleanup_old_thumbnails()
+    except Exception as e:
+        print(f"❌ Thumbnail cleanup failed: {e}")
+    with _cleanup_lock:
+        if _cleanup_timer is None:
+            return  # Scheduler was stopped while cleanup was running
+        _cleanup_timer = threading.Timer(interval, _run_scheduled_cleanup, args=(interval,))
+        _cleanup_timer.daemon = True
+        _cleanup_timer.start()
+
+
+def start_cleanup_scheduler(interval=THUMBNAIL_CLEANUP_INTERVAL_SECONDS):
+    """Start periodic cleanup of old thumbnails in a background thread"""
+    global _cleanup_timer
+    with _cleanup_lock:
+        if _cleanup_timer is not None:
+            return
+        _cleanup_timer = threading.Timer(0, _run_scheduled_cleanup, args=(interval,))
+        _cleanup_timer.daemon = True
+        _cleanup_timer.start()
+
+
+def stop_cleanup_scheduler():
+    """Stop the periodic cleanup thread"""
+    global _cleanup_timer
+    with _cleanup_lock:
+        if _cleanup_timer is not None:
+            _cleanup_timer.cancel()
+            _cleanup_timer = None
+
+
+def get_memory_usage_mb():
+    """Return the current resident memory of this process in MB, or None if unavailable"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+
+    # Without /proc only peak RSS (ru_maxrss) is available, which can't show per-request usage
+    return None
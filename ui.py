@@ -151,12 +151,12 @@ def create_gradio_ui():
                 with gr.Row():
                     thumbnail1_output = gr.Image(
                         label="🚀 Fast Generation (FLUX.1-schnell)",
-                        type="pil",
+                        type="filepath",
                         show_download_button=True
                     )
                     thumbnail2_output = gr.Image(
                         label="💎 Quality Generation (FLUX.1-dev)", 
-                        type="pil",
+                        type="filepath",
                         show_download_button=True
                     )
                 